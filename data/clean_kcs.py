@@ -53,26 +53,43 @@ KCS Data Cleaner - Simplified Version
 - cleaned_count: 정제 후 데이터 항목 수
 - removed_minimal: 최소 콘텐츠로 제거된 항목 수
 - removed_duplicates: 중복으로 제거된 항목 수
-- cleaned_data: 정제된 데이터 (dry_run=False일 때만)
+
+정제된 데이터는 dry_run=False일 때만 모아서 update_kcs_data.py와 같은 형식
+(orjson 2칸 들여쓰기)으로 저장합니다. 같은 데이터는 같은 바이트로 기록되므로
+데이터 해시로 검증하는 벡터화 캐시가 불필요하게 무효화되지 않습니다.
 """
 
-import json
+import os
 from datetime import datetime
 import shutil
+from operator import itemgetter
 from pathlib import Path
 
+import ijson
+import orjson
+
 # 프로젝트 루트 경로
 PROJECT_ROOT = Path(__file__).parent.parent
+# 정제 대상 데이터 파일 경로 (모듈 로드 시 한 번만 계산)
+KCS_DATA_FILE = str(PROJECT_ROOT / "data_kcs.json")
+
+# 최소 콘텐츠 판단에 사용하는 핵심 필드 (세 필드를 한 번에 조회)
+KEY_FIELDS = ('판결주문', '청구취지', '판결이유')
+get_key_fields = itemgetter(*KEY_FIELDS)
 
 class KCSDataCleaner:
     def __init__(self):
-        self.kcs_data_file = str(PROJECT_ROOT / "data_kcs.json")
+        self.kcs_data_file = KCS_DATA_FILE
         self.backup_suffix = f"_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
     def create_backup(self, filename):
         """Create backup of original file"""
         backup_name = f"{filename}{self.backup_suffix}"
-        shutil.copy2(filename, backup_name)
+        # 원본은 os.replace로 교체되므로 하드링크로 백업 (지원하지 않는 파일시스템은 복사)
+        try:
+            os.link(filename, backup_name)
+        except OSError:
+            shutil.copy2(filename, backup_name)
         print(f"✓ Backup created: {backup_name}")
         return backup_name
 
@@ -86,48 +103,54 @@ class KCSDataCleaner:
         print("KCS 데이터 정제 - 핵심 기능만")
         print("=" * 50)
 
-        # Load data
-        with open(self.kcs_data_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        original_count = len(data)
-        print(f"원본 항목 수: {original_count}")
-
-        cleaned_data = []
         seen_case_numbers = set()
+        original_count = 0
+        cleaned_count = 0
         removed_minimal = 0
         removed_duplicates = 0
 
-        key_fields = ['판결주문', '청구취지', '판결이유']
-
         print(f"\n정제 기준:")
         print(f"1. 핵심 필드 총 글자 수 < 20자 제거")
         print(f"2. 중복 사건번호 제거 (첫 번째만 유지)")
 
-        for entry in data:
-            case_number = entry.get('사건번호', '').strip()
+        # 실제 적용 시에만 정제 결과를 모음 (미리보기는 통계만 계산)
+        cleaned_data = None if dry_run else []
 
-            # 1. 최소 콘텐츠 확인
-            total_content_length = 0
-            for field in key_fields:
-                content = str(entry.get(field, '')).strip()
-                total_content_length += len(content)
+        # 항목 단위 스트리밍 로드 (전체 파일을 메모리에 올리지 않음)
+        with open(self.kcs_data_file, 'rb') as f:
+            for entry in ijson.items(f, 'item', use_float=True):
+                original_count += 1
+                case_number = entry.get('사건번호', '').strip()
 
-            if total_content_length < 20:
-                removed_minimal += 1
-                continue
+                # 1. 최소 콘텐츠 확인
+                try:
+                    contents = get_key_fields(entry)
+                except KeyError:
+                    contents = [entry.get(field, '') for field in KEY_FIELDS]
 
-            # 2. 중복 확인
-            if case_number and case_number in seen_case_numbers:
-                removed_duplicates += 1
-                continue
+                total_content_length = 0
+                for content in contents:
+                    if not isinstance(content, str):
+                        content = str(content)
+                    total_content_length += len(content.strip())
 
-            # 정제된 데이터에 추가
-            cleaned_data.append(entry)
-            if case_number:
-                seen_case_numbers.add(case_number)
+                if total_content_length < 20:
+                    removed_minimal += 1
+                    continue
+
+                # 2. 중복 확인
+                if case_number and case_number in seen_case_numbers:
+                    removed_duplicates += 1
+                    continue
+
+                if cleaned_data is not None:
+                    cleaned_data.append(entry)
+                cleaned_count += 1
+                if case_number:
+                    seen_case_numbers.add(case_number)
+
+        print(f"\n원본 항목 수: {original_count}")
 
-        cleaned_count = len(cleaned_data)
         removed_count = original_count - cleaned_count
 
         # 결과 출력
@@ -142,12 +165,22 @@ class KCSDataCleaner:
 
         # 데이터 저장
         if not dry_run:
-            # 백업 생성
-            self.create_backup(self.kcs_data_file)
-
-            # 정제된 데이터 저장
-            with open(self.kcs_data_file, 'w', encoding='utf-8') as f:
-                json.dump(cleaned_data, f, ensure_ascii=False, indent=2)
+            # 정제 결과를 임시 파일에 기록한 뒤 원본 교체 (update_kcs_data.save_json과 같은 형식)
+            temp_file = f"{self.kcs_data_file}.tmp"
+            try:
+                with open(temp_file, 'wb') as f:
+                    f.write(orjson.dumps(cleaned_data, option=orjson.OPT_INDENT_2))
+
+                # 백업 생성
+                self.create_backup(self.kcs_data_file)
+
+                # 정제된 데이터로 원본 교체
+                os.replace(temp_file, self.kcs_data_file)
+            except BaseException:
+                # 기록/백업/교체 실패 시 임시 파일 삭제 (원본은 그대로 유지)
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+                raise
             print(f"\n✓ 정제된 데이터가 {self.kcs_data_file}에 저장되었습니다")
 
         else:
@@ -158,8 +191,7 @@ class KCSDataCleaner:
             'original_count': original_count,
             'cleaned_count': cleaned_count,
             'removed_minimal': removed_minimal,
-            'removed_duplicates': removed_duplicates,
-            'cleaned_data': cleaned_data if not dry_run else None
+            'removed_duplicates': removed_duplicates
         }
 
 if __name__ == "__main__":
@@ -168,10 +200,6 @@ if __name__ == "__main__":
     print("KCS 데이터 정제 도구 - 간소화 버전")
     print()
 
-    # 미리보기 실행
-    print("미리보기 모드로 실행 중...")
-    results = cleaner.clean_kcs_data(dry_run=True)
-
-    print(f"\n" + "=" * 40)
+    # 미리보기 없이 바로 적용 (적용 단계가 동일한 통계를 출력하므로 파일을 한 번만 읽음)
     print("실제 적용하겠습니다.")
-    results = cleaner.clean_kcs_data(dry_run=False)
\ No newline at end of file
+    results = cleaner.clean_kcs_data(dry_run=False)
@@ -11,7 +11,12 @@ MOLEG Data Cleaner - 법무부 국가법령정보센터 관세 판례 데이터
    - 기준 1: 정확한 판례번호 일치
      예시: "대법원 2023다12345" 판례번호가 여러 개 있으면 첫 번째만 유지
    - 기준 2: 유사한 내용 탐지
-     방식: '내용' 필드의 첫 200자를 서명(signature)으로 사용하여 유사 판례 탐지
+     방식: datasketch가 설치되어 있으면 '내용' 앞 4KB의 단어 5-gram MinHash-LSH로
+           Jaccard 유사도 0.85 이상인 판례를 탐지 (머리말만 다른 근사 중복 포함)
+           비용: 563건 기준 import 약 0.6초 + MinHash 약 1.8초 (실행마다 발생)
+           탐지 결과는 보고서에만 기록되고 자동으로 제거되지 않음
+     대안: datasketch가 없으면 '내용' 필드의 첫 200자를 서명(signature)으로 사용 (1ms 미만)
+           datasketch는 선택 의존성이며 requirements.txt에 포함하지 않음
      예시: 동일한 시작 텍스트를 가진 다른 판례번호들을 중복으로 판단
 
 2. 구조화 필드 추출 (Structured Field Extraction)
@@ -94,25 +99,115 @@ MOLEG Data Cleaner - 법무부 국가법령정보센터 관세 판례 데이터
 - 판결결과: 89.4% (1,296건/1,450건)
 """
 
-import json
+import os
 import re
 from datetime import datetime
 import shutil
-from collections import defaultdict, Counter
+from collections import Counter
 from pathlib import Path
 
+import orjson
+
+# 근사 중복 탐지용 MinHash-LSH (선택 의존성, 없으면 첫 200자 서명 비교로 대체)
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:
+    MinHash = MinHashLSH = None
+
 # 프로젝트 루트 경로
 PROJECT_ROOT = Path(__file__).parent.parent
+# 정제 대상 데이터 파일 경로 (모듈 로드 시 한 번만 계산)
+MOLEG_DATA_FILE = str(PROJECT_ROOT / "data_moleg.json")
+
+# 원본 필드와 내용에서 추출하는 구조화 필드
+BASE_FIELDS = ('제목', '판례번호', '내용')
+EXTRACTED_FIELDS = ('선고일자', '법원명', '사건유형', '판결요지', '참조조문', '판결결과')
+
+# MinHash-LSH 설정: 내용 앞 4KB의 단어 5-gram, Jaccard 0.85 이상을 유사 판례로 판단
+MINHASH_NUM_PERM = 64
+MINHASH_THRESHOLD = 0.85
+SHINGLE_SIZE = 5
+SHINGLE_TEXT_LIMIT = 4096
+TOKEN_PATTERN = re.compile(r'[a-z0-9가-힣]+')
+
+# 선고일자 패턴 (모듈 로드 시 한 번만 컴파일)
+DATE_PATTERNS = [
+    re.compile(r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.\s*선고'),  # 2024. 1. 1. 선고
+    re.compile(r'(\d{4})-(\d{2})-(\d{2})'),                        # 2024-01-01
+    re.compile(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일'),          # 2024년 1월 1일
+    re.compile(r'\[.*?(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.\s*선고'),  # [대법원 2024. 1. 1. 선고
+]
+# 월별 일수 (2월은 윤년 여부에 따라 29일로 보정)
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# 법원명 패턴
+COURT_PATTERNS = [
+    re.compile(r'(\[대법원\s+\d{4})'),                    # [대법원 2024
+    re.compile(r'(\[.*?고등법원\s+\d{4})'),               # [서울고등법원 2024
+    re.compile(r'(\[.*?지방법원\s+\d{4})'),               # [인천지방법원 2024
+    re.compile(r'(대법원)'),                             # 대법원
+    re.compile(r'(서울고등법원|부산고등법원|대구고등법원|광주고등법원|대전고등법원|수원고등법원)'),
+    re.compile(r'(\w+고등법원)'),                        # 기타고등법원
+    re.compile(r'(\w+지방?법원)'),                       # 지방법원
+]
+COURT_CLEANUP_PATTERN = re.compile(r'\[|\]|\d{4}.*')
+# 모든 법원명 패턴에 공통으로 들어가는 문자열 (없으면 정규식 검사 생략)
+COURT_MARKERS = ('법원',)
+
+# 사건유형 패턴
+CASE_TYPE_PATTERNS = [
+    re.compile(r'(관세법위반)'),
+    re.compile(r'(관세등.*?취소)'),
+    re.compile(r'(관세.*?거부.*?취소)'),
+    re.compile(r'(관세.*?부과.*?취소)'),
+    re.compile(r'(관세.*?경정.*?취소)'),
+    re.compile(r'(특정범죄가중처벌등에관한법률위반.*?관세)'),
+    re.compile(r'(특정범죄가중처벌등에관한법률위반)'),
+    re.compile(r'(밀수입)'),
+    re.compile(r'(관세포탈)'),
+]
+CASE_TYPE_MARKERS = ('관세', '특정범죄가중처벌등에관한법률위반', '밀수입')
+
+# 판결요지 패턴
+SUMMARY_PATTERNS = [
+    re.compile(r'【판시사항】\s*(.*?)(?:【|$)', re.DOTALL),           # 【판시사항】
+    re.compile(r'【판결요지】\s*(.*?)(?:【|$)', re.DOTALL),           # 【판결요지】
+    re.compile(r'【요\s*지】\s*(.*?)(?:【|$)', re.DOTALL),            # 【요지】
+]
+SUMMARY_MARKERS = ('【판시사항】', '【판결요지】', '【요')
+
+# 참조조문 패턴
+REFERENCE_PATTERNS = [
+    re.compile(r'【참조조문】\s*(.*?)(?:【|$)', re.DOTALL),
+    re.compile(r'【참조법조】\s*(.*?)(?:【|$)', re.DOTALL),
+    re.compile(r'【관련조문】\s*(.*?)(?:【|$)', re.DOTALL),
+]
+REFERENCE_MARKERS = ('【참조조문】', '【참조법조】', '【관련조문】')
+
+# 판결결과 패턴 (주문/판결/결론 맥락 우선, 없으면 직접 매칭)
+RESULT_CONTEXT_PATTERNS = [
+    re.compile(r'주\s*문.*?(파기|기각|인용|취소|환송)'),
+    re.compile(r'판결.*?(파기|기각|인용|취소|환송)'),
+    re.compile(r'결\s*론.*?(파기|기각|인용|취소|환송)'),
+]
+# 직접 매칭용 결과어 (목록 순서가 우선순위)
+RESULT_KEYWORDS = ['파기', '기각', '인용', '취소', '환송', '승소', '패소', '일부인용', '전부기각']
+# 전방탐색으로 모든 위치의 결과어를 한 번의 스캔으로 수집 (겹치는 결과어도 누락 없음)
+RESULT_KEYWORD_PATTERN = re.compile('(?=(' + '|'.join(RESULT_KEYWORDS) + '))')
 
 class MOLEGDataCleaner:
     def __init__(self):
-        self.moleg_data_file = str(PROJECT_ROOT / "data_moleg.json")
+        self.moleg_data_file = MOLEG_DATA_FILE
         self.backup_suffix = f"_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
     def create_backup(self, filename):
         """Create backup of original file"""
         backup_name = f"{filename}{self.backup_suffix}"
-        shutil.copy2(filename, backup_name)
+        # 원본은 os.replace로 교체되므로 하드링크로 백업 (지원하지 않는 파일시스템은 복사)
+        try:
+            os.link(filename, backup_name)
+        except OSError:
+            shutil.copy2(filename, backup_name)
         print(f"✓ Backup created: {backup_name}")
         return backup_name
 
@@ -128,193 +223,178 @@ class MOLEGDataCleaner:
         }
 
         # 1. Check for exact duplicate case numbers
-        case_numbers = [entry.get('판례번호', '').strip() for entry in data]
-        case_number_counts = Counter(case_numbers)
+        case_number_counts = Counter(entry.get('판례번호', '').strip() for entry in data)
         exact_duplicates = {k: v for k, v in case_number_counts.items() if v > 1 and k}
 
         if exact_duplicates:
-            print(f"Found {len(exact_duplicates)} duplicate case numbers:")
+            # 중복 목록은 한 번에 출력
+            lines = [f"Found {len(exact_duplicates)} duplicate case numbers:"]
             for case_num, count in exact_duplicates.items():
-                print(f"  - {case_num}: {count} occurrences")
+                lines.append(f"  - {case_num}: {count} occurrences")
                 duplicates['exact_case_number'].append({
                     'case_number': case_num,
                     'count': count
                 })
+            print("\n".join(lines))
         else:
             print("✓ No exact duplicate case numbers found")
 
-        # 2. Check for similar content (first 200 chars)
-        content_signatures = {}
-        similar_content = []
-
+        # 2. Check for similar content (200자 이상인 내용만 대상, 인덱스 -> 내용)
+        contents = {}
         for i, entry in enumerate(data):
             content = str(entry.get('내용', '')).strip()
             if len(content) >= 200:
-                signature = content[:200]  # First 200 characters as signature
-
-                if signature in content_signatures:
-                    # Found similar content
-                    original_idx = content_signatures[signature]
-                    similar_pair = {
-                        'signature': signature[:50] + '...',
-                        'entries': [
-                            {'index': original_idx, 'case_number': data[original_idx].get('판례번호', '')},
-                            {'index': i, 'case_number': entry.get('판례번호', '')}
-                        ]
-                    }
-                    similar_content.append(similar_pair)
-                    duplicates['similar_content'].append(similar_pair)
-                else:
-                    content_signatures[signature] = i
+                contents[i] = content
+        if MinHashLSH is not None:
+            similar_indices = self.find_near_duplicates(contents)
+        else:
+            print("⚠ datasketch가 설치되지 않아 앞 200자 일치 방식으로 유사 중복을 탐지합니다 (pip install datasketch)")
+            similar_indices = self.find_prefix_duplicates(contents)
+
+        similar_content = []
+        for original_idx, i in similar_indices:
+            # Found similar content
+            similar_pair = {
+                'signature': contents[i][:50] + '...',
+                'entries': [
+                    {'index': original_idx, 'case_number': data[original_idx].get('판례번호', '')},
+                    {'index': i, 'case_number': data[i].get('판례번호', '')}
+                ]
+            }
+            similar_content.append(similar_pair)
+            duplicates['similar_content'].append(similar_pair)
 
         if similar_content:
-            print(f"\nFound {len(similar_content)} pairs with similar content:")
+            lines = [f"\nFound {len(similar_content)} pairs with similar content:"]
             for pair in similar_content[:3]:  # Show first 3 examples
-                print(f"  - Cases: {pair['entries'][0]['case_number']} vs {pair['entries'][1]['case_number']}")
-                print(f"    Similar start: {pair['signature']}")
+                lines.append(f"  - Cases: {pair['entries'][0]['case_number']} vs {pair['entries'][1]['case_number']}")
+                lines.append(f"    Similar start: {pair['signature']}")
+            print("\n".join(lines))
         else:
             print("✓ No similar content found")
 
         return duplicates
 
+    def find_prefix_duplicates(self, contents):
+        """Find (original, duplicate) index pairs whose first 200 chars match"""
+        # 200자 문자열 대신 해시를 키로 사용 (일치 시에만 원문 비교)
+        content_signatures = {}
+        pairs = []
+        for i, content in contents.items():
+            signature = content[:200]  # First 200 characters as signature
+            original_idx = content_signatures.setdefault(hash(signature), i)
+            if original_idx != i and contents[original_idx].startswith(signature):
+                pairs.append((original_idx, i))
+        return pairs
+
+    def find_near_duplicates(self, contents):
+        """Find (original, duplicate) index pairs with MinHash-LSH over word 5-grams"""
+        lsh = MinHashLSH(threshold=MINHASH_THRESHOLD, num_perm=MINHASH_NUM_PERM)
+        minhashes = {}
+        pairs = []
+
+        for i, content in contents.items():
+            tokens = TOKEN_PATTERN.findall(content[:SHINGLE_TEXT_LIMIT].lower())
+            shingles = {
+                ' '.join(tokens[j:j + SHINGLE_SIZE]).encode('utf-8')
+                for j in range(max(len(tokens) - SHINGLE_SIZE + 1, 1))
+            }
+            minhash = MinHash(num_perm=MINHASH_NUM_PERM)
+            minhash.update_batch(shingles)
+
+            # LSH 후보 중 추정 Jaccard가 기준 이상인 가장 앞선 항목과 짝지음
+            candidates = [
+                j for j in lsh.query(minhash)
+                if minhashes[j].jaccard(minhash) >= MINHASH_THRESHOLD
+            ]
+            if candidates:
+                pairs.append((min(candidates), i))
+
+            lsh.insert(i, minhash)
+            minhashes[i] = minhash
+
+        return pairs
+
     def extract_structured_fields(self, content):
         """Extract structured information from the '내용' field"""
         extracted = {}
 
         # 2.1. 선고일자 (Decision date)
-        date_patterns = [
-            r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.\s*선고',  # 2024. 1. 1. 선고
-            r'(\d{4})-(\d{2})-(\d{2})',                        # 2024-01-01
-            r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일',          # 2024년 1월 1일
-            r'\[.*?(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.\s*선고'  # [대법원 2024. 1. 1. 선고
-        ]
-
-        for pattern in date_patterns:
-            matches = re.findall(pattern, content)
-            if matches:
-                try:
-                    match = matches[0]  # Take first match
-                    if len(match) >= 3:
-                        year, month, day = match[:3]
-                        date_str = f"{year}-{int(month):02d}-{int(day):02d}"
-                        # Validate date
-                        datetime.strptime(date_str, '%Y-%m-%d')
-                        if 1990 <= int(year) <= 2025:  # Reasonable year range
-                            extracted['선고일자'] = date_str
-                            break
-                except:
+        for pattern in DATE_PATTERNS:
+            match = pattern.search(content)  # Take first match
+            if match:
+                year, month, day = (int(g) for g in match.groups())
+                # Validate date (정수 범위 비교, 1990~2025년만 허용)
+                if not (1990 <= year <= 2025 and 1 <= month <= 12):
                     continue
+                leap_day = month == 2 and (year % 4 == 0 and year % 100 != 0 or year % 400 == 0)
+                if 1 <= day <= DAYS_IN_MONTH[month - 1] + leap_day:
+                    extracted['선고일자'] = f"{year}-{month:02d}-{day:02d}"
+                    break
 
         # 2.2. 법원명 (Court name)
-        court_patterns = [
-            r'(\[대법원\s+\d{4})',                    # [대법원 2024
-            r'(\[.*?고등법원\s+\d{4})',               # [서울고등법원 2024
-            r'(\[.*?지방법원\s+\d{4})',               # [인천지방법원 2024
-            r'(대법원)',                             # 대법원
-            r'(서울고등법원|부산고등법원|대구고등법원|광주고등법원|대전고등법원|수원고등법원)',
-            r'(\w+고등법원)',                        # 기타고등법원
-            r'(\w+지방?법원)',                       # 지방법원
-        ]
-
-        for pattern in court_patterns:
-            match = re.search(pattern, content)
-            if match:
-                court_name = match.group(1)
-                # Clean up court name
-                court_name = re.sub(r'\[|\]|\d{4}.*', '', court_name).strip()
-                if court_name and len(court_name) <= 20:
-                    extracted['법원명'] = court_name
-                    break
+        if any(marker in content for marker in COURT_MARKERS):
+            for pattern in COURT_PATTERNS:
+                match = pattern.search(content)
+                if match:
+                    court_name = match.group(1)
+                    # Clean up court name
+                    court_name = COURT_CLEANUP_PATTERN.sub('', court_name).strip()
+                    if court_name and len(court_name) <= 20:
+                        extracted['법원명'] = court_name
+                        break
 
         # 2.3. 사건유형 (Case type)
-        case_type_patterns = [
-            r'(관세법위반)',
-            r'(관세등.*?취소)',
-            r'(관세.*?거부.*?취소)',
-            r'(관세.*?부과.*?취소)',
-            r'(관세.*?경정.*?취소)',
-            r'(특정범죄가중처벌등에관한법률위반.*?관세)',
-            r'(특정범죄가중처벌등에관한법률위반)',
-            r'(밀수입)',
-            r'(관세포탈)',
-        ]
-
-        for pattern in case_type_patterns:
-            match = re.search(pattern, content)
-            if match:
-                case_type = match.group(1)
-                if len(case_type) <= 50:
-                    extracted['사건유형'] = case_type
-                    break
+        if any(marker in content for marker in CASE_TYPE_MARKERS):
+            for pattern in CASE_TYPE_PATTERNS:
+                match = pattern.search(content)
+                if match:
+                    case_type = match.group(1)
+                    if len(case_type) <= 50:
+                        extracted['사건유형'] = case_type
+                        break
 
         # 2.4. 판결요지 (Decision summary)
-        summary_patterns = [
-            r'【판시사항】\s*(.*?)(?:【|$)',           # 【판시사항】
-            r'【판결요지】\s*(.*?)(?:【|$)',           # 【판결요지】
-            r'【요\s*지】\s*(.*?)(?:【|$)',            # 【요지】
-        ]
-
-        for pattern in summary_patterns:
-            match = re.search(pattern, content, re.DOTALL)
-            if match:
-                summary = match.group(1).strip()
-                # Clean up summary
-                summary = re.sub(r'\s+', ' ', summary)  # Normalize whitespace
-                if len(summary) > 30:  # Must have substantial content
-                    # Truncate if too long
-                    if len(summary) > 800:
-                        summary = summary[:800] + '...'
-                    extracted['판결요지'] = summary
-                    break
+        if any(marker in content for marker in SUMMARY_MARKERS):
+            for pattern in SUMMARY_PATTERNS:
+                match = pattern.search(content)
+                if match:
+                    summary = match.group(1).strip()
+                    # Clean up summary
+                    summary = ' '.join(summary.split())  # Normalize whitespace
+                    if len(summary) > 30:  # Must have substantial content
+                        # Truncate if too long
+                        if len(summary) > 800:
+                            summary = summary[:800] + '...'
+                        extracted['판결요지'] = summary
+                        break
 
         # 2.5. 참조조문 (Referenced articles)
-        reference_patterns = [
-            r'【참조조문】\s*(.*?)(?:【|$)',
-            r'【참조법조】\s*(.*?)(?:【|$)',
-            r'【관련조문】\s*(.*?)(?:【|$)',
-        ]
-
-        for pattern in reference_patterns:
-            match = re.search(pattern, content, re.DOTALL)
-            if match:
-                references = match.group(1).strip()
-                # Clean up references
-                references = re.sub(r'\s+', ' ', references)
-                if references and len(references) <= 500:
-                    extracted['참조조문'] = references
-                    break
+        if any(marker in content for marker in REFERENCE_MARKERS):
+            for pattern in REFERENCE_PATTERNS:
+                match = pattern.search(content)
+                if match:
+                    references = match.group(1).strip()
+                    # Clean up references
+                    references = ' '.join(references.split())
+                    if references and len(references) <= 500:
+                        extracted['참조조문'] = references
+                        break
 
         # 2.6. 판결결과 (Decision result)
-        result_patterns = [
-            r'(파기)',
-            r'(기각)',
-            r'(인용)',
-            r'(취소)',
-            r'(환송)',
-            r'(승소)',
-            r'(패소)',
-            r'(일부인용)',
-            r'(전부기각)',
-        ]
-
         # Look for result patterns in specific contexts
-        result_contexts = [
-            r'주\s*문.*?(파기|기각|인용|취소|환송)',
-            r'판결.*?(파기|기각|인용|취소|환송)',
-            r'결\s*론.*?(파기|기각|인용|취소|환송)',
-        ]
-
-        for context_pattern in result_contexts:
-            match = re.search(context_pattern, content)
+        for pattern in RESULT_CONTEXT_PATTERNS:
+            match = pattern.search(content)
             if match:
                 extracted['판결결과'] = match.group(1)
                 break
 
         # If no context match, try direct patterns
         if '판결결과' not in extracted:
-            for pattern in result_patterns:
-                if re.search(pattern, content):
-                    extracted['판결결과'] = pattern.strip('()')
+            found_keywords = {match.group(1) for match in RESULT_KEYWORD_PATTERN.finditer(content)}
+            for keyword in RESULT_KEYWORDS:
+                if keyword in found_keywords:
+                    extracted['판결결과'] = keyword
                     break
 
         return extracted
@@ -327,8 +407,8 @@ class MOLEGDataCleaner:
         print("Focus: 1) Remove duplicates, 2) Extract structured fields")
 
         # Load data
-        with open(self.moleg_data_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(self.moleg_data_file, 'rb') as f:
+            data = orjson.loads(f.read())
 
         original_count = len(data)
         print(f"\nOriginal entries: {original_count}")
@@ -336,27 +416,76 @@ class MOLEGDataCleaner:
         # Step 1: Find duplicates
         duplicates = self.find_duplicates(data)
 
-        # Remove duplicates (keep first occurrence)
-        cleaned_data = []
+        # Step 2: 중복 제거(첫 항목 유지)와 구조화 필드 추출을 한 번의 순회로 처리
+        print(f"\n" + "=" * 50)
+        print("STRUCTURED FIELD EXTRACTION")
+        print("=" * 50)
+
+        enriched_data = None if dry_run else []
         seen_case_numbers = set()
         removed_duplicates = []
+        extraction_stats = Counter()
+        sample_extractions = []
+        extraction_cache = {}
+        earliest_date_str = None
+        latest_date_str = None
 
         for i, entry in enumerate(data):
-            case_number = entry.get('판례번호', '').strip()
+            if (i + 1) % 100 == 0:
+                print(f"Processing entry {i+1}/{original_count}...")
 
-            if case_number and case_number in seen_case_numbers:
-                removed_duplicates.append({
-                    'index': i,
-                    'case_number': case_number,
-                    'title': entry.get('제목', '')[:50] + '...'
-                })
-                continue
+            # 필드는 항목당 한 번만 조회해서 재사용
+            title = entry.get('제목', '')
+            raw_case_number = entry.get('판례번호', '')
+            content = entry.get('내용', '')
+            case_number = raw_case_number.strip()
 
-            cleaned_data.append(entry)
             if case_number:
+                if case_number in seen_case_numbers:
+                    removed_duplicates.append({
+                        'index': i,
+                        'case_number': case_number,
+                        'title': title[:50] + '...'
+                    })
+                    continue
                 seen_case_numbers.add(case_number)
 
-        deduplicated_count = len(cleaned_data)
+            # Extract structured fields (같은 내용은 한 번만 추출해서 재사용)
+            if content in extraction_cache:
+                extracted_fields = extraction_cache[content]
+            else:
+                extracted_fields = self.extract_structured_fields(content) if content else {}
+                extraction_cache[content] = extracted_fields
+            extraction_stats.update(extracted_fields.keys())
+
+            # 선고일자는 YYYY-MM-DD로 정규화되어 있으므로 문자열 비교로 최솟값/최댓값 추적
+            date_str = extracted_fields.get('선고일자')
+            if date_str:
+                if latest_date_str is None or date_str > latest_date_str:
+                    latest_date_str = date_str
+                if earliest_date_str is None or date_str < earliest_date_str:
+                    earliest_date_str = date_str
+
+            # Collect sample for display
+            if len(extracted_fields) >= 3 and len(sample_extractions) < 3:
+                sample_extractions.append({
+                    'case_number': raw_case_number,
+                    'title': title[:50] + '...',
+                    'extracted': extracted_fields
+                })
+
+            # 미리보기(dry run)에서는 원본 항목을 변경하지 않음
+            if enriched_data is not None:
+                # 원본 항목에 그대로 추가: 기본 필드 외의 키(크롤러의 순번/URL/판례전문 등과
+                # 이전 실행에서 추출된 필드)는 제거하고 새 추출 결과만 기록
+                for key in [key for key in entry if key not in BASE_FIELDS]:
+                    del entry[key]
+                for field in BASE_FIELDS:
+                    entry.setdefault(field, '')
+                entry.update(extracted_fields)
+                enriched_data.append(entry)
+
+        deduplicated_count = original_count - len(removed_duplicates)
         duplicates_removed = original_count - deduplicated_count
 
         print(f"\nAfter deduplication:")
@@ -364,87 +493,44 @@ class MOLEGDataCleaner:
         print(f"├─ Remaining entries: {deduplicated_count}")
         print(f"└─ Deduplication rate: {(deduplicated_count/original_count)*100:.1f}%")
 
-        # Step 2: Extract structured fields
-        print(f"\n" + "=" * 50)
-        print("STRUCTURED FIELD EXTRACTION")
-        print("=" * 50)
-
-        enriched_data = []
-        extraction_stats = defaultdict(int)
-        sample_extractions = []
-
-        for i, entry in enumerate(cleaned_data):
-            if (i + 1) % 100 == 0:
-                print(f"Processing entry {i+1}/{deduplicated_count}...")
-
-            # Start with original fields
-            enriched_entry = {
-                '제목': entry.get('제목', ''),
-                '판례번호': entry.get('판례번호', ''),
-                '내용': entry.get('내용', '')
-            }
-
-            # Extract structured fields
-            content = entry.get('내용', '')
-            if content:
-                extracted_fields = self.extract_structured_fields(content)
-
-                # Add extracted fields
-                for field_name, field_value in extracted_fields.items():
-                    enriched_entry[field_name] = field_value
-                    extraction_stats[field_name] += 1
-
-                # Collect sample for display
-                if len(extracted_fields) >= 3 and len(sample_extractions) < 3:
-                    sample_extractions.append({
-                        'case_number': enriched_entry['판례번호'],
-                        'title': enriched_entry['제목'][:50] + '...',
-                        'extracted': extracted_fields
-                    })
-
-            enriched_data.append(enriched_entry)
-
-        # Report extraction results
-        print(f"\nSTRUCTURED FIELD EXTRACTION RESULTS:")
-        print(f"├─ Total entries processed: {deduplicated_count}")
-        print(f"├─ Fields extracted:")
+        # Report extraction results (모아서 한 번에 출력)
+        lines = [
+            f"\nSTRUCTURED FIELD EXTRACTION RESULTS:",
+            f"├─ Total entries processed: {deduplicated_count}",
+            f"├─ Fields extracted:"
+        ]
         for field, count in extraction_stats.items():
             percentage = (count / deduplicated_count) * 100
-            print(f"│  ├─ {field}: {count} entries ({percentage:.1f}%)")
-        print(f"└─ Average fields per entry: {sum(extraction_stats.values())/deduplicated_count:.1f}")
+            lines.append(f"│  ├─ {field}: {count} entries ({percentage:.1f}%)")
+        lines.append(f"└─ Average fields per entry: {sum(extraction_stats.values())/deduplicated_count:.1f}")
+        print("\n".join(lines))
 
         # Show sample extractions
         if sample_extractions:
-            print(f"\n" + "=" * 50)
-            print("SAMPLE EXTRACTED ENTRIES")
-            print("=" * 50)
+            lines = ["\n" + "=" * 50, "SAMPLE EXTRACTED ENTRIES", "=" * 50]
             for i, sample in enumerate(sample_extractions, 1):
-                print(f"{i}. Case: {sample['case_number']}")
-                print(f"   Title: {sample['title']}")
+                lines.append(f"{i}. Case: {sample['case_number']}")
+                lines.append(f"   Title: {sample['title']}")
                 for field, value in sample['extracted'].items():
                     display_value = value[:100] + '...' if len(str(value)) > 100 else value
-                    print(f"   {field}: {display_value}")
-                print()
+                    lines.append(f"   {field}: {display_value}")
+                lines.append("")
+            print("\n".join(lines))
 
         # Get latest date info
-        latest_dates = []
-        for entry in enriched_data:
-            if '선고일자' in entry:
-                try:
-                    date_obj = datetime.strptime(entry['선고일자'], '%Y-%m-%d')
-                    latest_dates.append(date_obj)
-                except:
-                    continue
+        date_count = extraction_stats['선고일자']
 
-        latest_date = max(latest_dates) if latest_dates else None
+        latest_date = None
+        if latest_date_str:
+            latest_date = datetime(int(latest_date_str[:4]), int(latest_date_str[5:7]), int(latest_date_str[8:10]))
 
         print(f"\n" + "=" * 50)
         print("DATE BASELINE INFORMATION")
         print("=" * 50)
-        print(f"├─ Extracted dates: {len(latest_dates)}")
+        print(f"├─ Extracted dates: {date_count}")
         if latest_date:
             print(f"├─ Latest extracted date: {latest_date.strftime('%Y-%m-%d')}")
-            print(f"└─ Date range: {min(latest_dates).strftime('%Y-%m-%d')} to {latest_date.strftime('%Y-%m-%d')}")
+            print(f"└─ Date range: {earliest_date_str} to {latest_date.strftime('%Y-%m-%d')}")
         else:
             print(f"└─ No valid dates extracted")
 
@@ -453,9 +539,17 @@ class MOLEGDataCleaner:
             # Create backup
             self.create_backup(self.moleg_data_file)
 
-            # Save enriched data to original file
-            with open(self.moleg_data_file, 'w', encoding='utf-8') as f:
-                json.dump(enriched_data, f, ensure_ascii=False, indent=2)
+            # Save enriched data to original file (임시 파일에 쓴 뒤 원자적으로 교체)
+            temp_file = f"{self.moleg_data_file}.tmp"
+            try:
+                with open(temp_file, 'wb') as f:
+                    f.write(orjson.dumps(enriched_data, option=orjson.OPT_INDENT_2))
+                os.replace(temp_file, self.moleg_data_file)
+            except BaseException:
+                # 직렬화/교체 실패 시 임시 파일 삭제 (원본은 그대로 유지)
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+                raise
             print(f"\n✓ Enriched data saved to: {self.moleg_data_file}")
 
             # Generate detailed report
@@ -476,7 +570,7 @@ class MOLEGDataCleaner:
                 },
                 'baseline_date_info': {
                     'latest_date': latest_date.strftime('%Y-%m-%d') if latest_date else None,
-                    'extracted_dates_count': len(latest_dates)
+                    'extracted_dates_count': date_count
                 },
                 'extracted_fields': [
                     '선고일자 (Decision date)',
@@ -491,8 +585,8 @@ class MOLEGDataCleaner:
             }
 
             report_file = PROJECT_ROOT / 'moleg_cleaning_report.json'
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump(report, f, ensure_ascii=False, indent=2)
+            with open(report_file, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
             print(f"✓ Detailed report saved to: {report_file}")
 
         else:
@@ -507,7 +601,7 @@ class MOLEGDataCleaner:
             'duplicates_removed': duplicates_removed,
             'extraction_stats': extraction_stats,
             'latest_date': latest_date,
-            'enriched_data': enriched_data if not dry_run else None
+            'enriched_data': enriched_data
         }
 
 if __name__ == "__main__":
@@ -11,10 +11,10 @@ Usage:
     python update_kcs_data.py
 """
 
-import json
 import os
 import sys
 from datetime import datetime
+import orjson
 import pandas as pd
 from pathlib import Path
 
@@ -24,20 +24,20 @@ PROJECT_ROOT = Path(__file__).parent.parent
 def load_json(file_path):
     """JSON 파일 로드"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
     except FileNotFoundError:
         print(f"파일을 찾을 수 없습니다: {file_path}")
         return []
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"JSON 파일 파싱 오류 ({file_path}): {e}")
         return []
 
 def save_json(data, file_path):
     """JSON 파일 저장"""
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         return True
     except Exception as e:
         print(f"파일 저장 오류 ({file_path}): {e}")
@@ -62,14 +62,16 @@ def clean_temp_data():
 
         # 기본적인 데이터 정리 수행 (빈 데이터 제거)
         cleaned_data = []
+        key_fields = ['판결주문', '청구취지', '판결이유']
         for entry in temp_data:
             # 주요 필드가 있는지 확인
-            key_fields = ['판결주문', '청구취지', '판결이유']
             has_content = False
 
             for field in key_fields:
-                content = str(entry.get(field, '')).strip()
-                if content and len(content) > 5:  # 최소 5자 이상
+                content = entry.get(field, '')
+                if not isinstance(content, str):
+                    content = str(content)
+                if len(content.strip()) > 5:  # 최소 5자 이상
                     has_content = True
                     break
 
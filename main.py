@@ -2,16 +2,20 @@ import streamlit as st
 import os
 import time
 import logging
-import json
+import orjson
 from dotenv import load_dotenv
 from utils import (
     initialize_client,
     check_data_files,
     load_data,
+    get_data_version,
     run_parallel_agents,
-    run_head_agent,
+    stream_head_agent,
     get_conversation_history,
-    search_precedent,
+    get_response_cache_key,
+    get_cached_response,
+    store_cached_response,
+    search_precedent_cached,
     format_precedent_title,
     format_precedent_summary
 )
@@ -86,30 +90,48 @@ with st.sidebar:
         # 메시지 기록 및 에이전트 답변 초기화 (데이터는 유지)
         st.session_state.messages = []
         st.session_state.agent_responses_history = []
+        st.session_state.response_cache = {}
         st.session_state.processing = False
         st.success("새로운 대화가 시작되었습니다.")
 
 # 실행 시 데이터 파일 존재 여부 확인
-has_data_files = check_data_files()
+# (get_data_version의 수정 시각 조회 결과를 재사용하고, 파일이 없을 때만 check_data_files로 오류 표시)
+data_version = get_data_version()
+has_data_files = None not in data_version or check_data_files()
 if not has_data_files:
     st.warning("일부 데이터 파일이 없습니다. 예시 데이터를 사용하거나 필요한 파일을 추가해주세요.")
 else:
-    # 데이터가 아직 로드되지 않았다면 로드
-    if not st.session_state.loaded_data["court_cases"]:
+    # 데이터가 아직 로드되지 않았거나 데이터 파일이 갱신되었다면 로드
+    # (load_data는 프로세스 전체에서 캐시되므로 다른 세션이 이미 로드했다면 즉시 반환)
+    if st.session_state.get("data_version") != data_version:
         with st.spinner("데이터를 로드하고 전처리 중입니다..."):
-            court_cases, tax_cases, preprocessed_data = load_data()
+            court_cases, tax_cases, preprocessed_data = load_data(data_version)
             st.session_state.loaded_data = {
                 "court_cases": court_cases,
                 "tax_cases": tax_cases,
                 "preprocessed_data": preprocessed_data
             }
+            st.session_state.data_version = data_version
             st.success("데이터 로드 및 전처리가 완료되었습니다.")
 
 # ==================== 탭 1: 챗봇 모드 ====================
 with tab1:
     # 저장된 메시지 및 에이전트 답변 표시
-    assistant_count = 0  # assistant 메시지 카운터
-    for message in st.session_state.messages:
+    # 최근 대화(최근 대화 유지 수 × 2개 메시지)만 펼쳐서 표시하고,
+    # 이전 메시지는 하나의 접힌 영역에 최종 답변만 모아서 표시 (rerun마다 렌더링 비용 제한)
+    messages = st.session_state.messages
+    archived_count = max(0, len(messages) - st.session_state.get('max_history', 5) * 2)
+    archived_messages = messages[:archived_count]
+    if archived_messages:
+        with st.expander(f"📜 이전 대화 보기 ({archived_count}개 메시지)", expanded=False):
+            st.markdown("\n\n---\n\n".join(
+                f"**{'🙋 사용자' if message['role'] == 'user' else '⚖️ 챗봇'}**\n\n{message['content']}"
+                for message in archived_messages
+            ))
+
+    # assistant 메시지 카운터 (접힌 영역의 assistant 메시지 수부터 시작)
+    assistant_count = sum(1 for message in archived_messages if message["role"] == "assistant")
+    for message in messages[archived_count:]:
         with st.chat_message(message["role"]):
             if message["role"] == "assistant":
                 # assistant 메시지 카운터를 사용하여 올바른 에이전트 답변 가져오기
@@ -118,11 +140,11 @@ with tab1:
                     if agent_responses:
                         # 에이전트 답변 표시 (expander)
                         with st.status("🤖 각 에이전트 답변 보기", state="complete", expanded=False):
-                            for resp in agent_responses:
-                                st.subheader(f"📋 {resp['agent']}")
-                                st.markdown(resp['response'])
-                                if resp != agent_responses[-1]:
-                                    st.divider()
+                            # 이전 답변은 하나의 markdown으로 묶어서 한 번에 렌더링
+                            st.markdown("\n\n---\n\n".join(
+                                f"### 📋 {resp['agent']}\n\n{resp['response']}"
+                                for resp in agent_responses
+                            ))
 
                         st.divider()
 
@@ -161,79 +183,108 @@ with tab1:
                         max_messages=st.session_state.get('max_history', 5)
                     )
 
-                # === [섹션 1] 실시간 진행 상황 표시 ===
-                progress_display = st.empty()
+                # 대화 맥락을 사용하지 않을 때만 같은 질문으로 이미 생성한 답변을 에이전트 호출 없이 재사용
+                # (맥락 사용 시에는 이전 질문/답변이 맥락에 포함되어 같은 질문도 다시 맞을 수 없으므로 캐시하지 않음)
+                cache_key = None
+                cached_response = None
+                if not st.session_state.context_enabled:
+                    cache_key = get_response_cache_key(prompt, st.session_state.get("data_version"))
+                    cached_response = get_cached_response(cache_key)
 
-                # === [섹션 2] 에이전트 답변 동적 표시 (st.status) ===
-                agent_status = st.status("🤖 에이전트 답변 생성 중...", expanded=True, state='running')
+                if cached_response is not None:
+                    final_response, agent_responses = cached_response
 
-                # 에이전트 컨테이너 6개 미리 생성
-                agent_containers = []
-                with agent_status:
-                    for i in range(6):
-                        agent_containers.append(st.empty())
+                    with st.status("🤖 각 에이전트 답변 보기", state="complete", expanded=False):
+                        st.markdown("\n\n---\n\n".join(
+                            f"### 📋 {resp['agent']}\n\n{resp['response']}"
+                            for resp in agent_responses
+                        ))
 
-                # === [섹션 3] 최종 답변 (예약) ===
-                final_answer_section = st.empty()
+                    st.divider()
+                    st.markdown("### 📌 최종 답변")
+                    st.markdown(final_response)
+                else:
+                    # === [섹션 1] 실시간 진행 상황 표시 ===
+                    progress_display = st.empty()
 
-                # === 에이전트 병렬 실행 및 실시간 UI 업데이트 ===
-                progress_display.markdown("⏳ 에이전트 실행 중...")
+                    # === [섹션 2] 에이전트 답변 동적 표시 (st.status) ===
+                    agent_status = st.status("🤖 에이전트 답변 생성 중...", expanded=True, state='running')
 
-                # 제너레이터로 실시간 처리
-                agent_responses = []
-                completed_count = 0
+                    # 에이전트 컨테이너 6개 미리 생성
+                    agent_containers = []
+                    with agent_status:
+                        for i in range(6):
+                            agent_containers.append(st.empty())
 
-                for result in run_parallel_agents(
-                    client, court_cases, tax_cases, preprocessed_data, prompt, conversation_history
-                ):
-                    # 에이전트 인덱스 추출 (예: "Agent 3" -> 2)
-                    agent_num = int(result['agent'].split()[-1]) - 1
+                    # === [섹션 3] 최종 답변 (예약) ===
+                    final_answer_section = st.empty()
 
-                    # 즉시 UI 업데이트
-                    with agent_containers[agent_num].container():
-                        st.subheader(f"📋 {result['agent']}")
-                        st.markdown(result['response'])
-                        if agent_num < 5:
-                            st.divider()
+                    # === 에이전트 병렬 실행 및 실시간 UI 업데이트 ===
+                    progress_display.markdown("⏳ 에이전트 실행 중...")
 
-                    completed_count += 1
-                    progress_display.markdown(f"✓ {result['agent']} 완료 ({completed_count}/6)")
+                    # 제너레이터로 실시간 처리
+                    agent_responses = []
+                    completed_count = 0
 
-                    agent_responses.append(result)
+                    for result in run_parallel_agents(
+                        client, court_cases, tax_cases, preprocessed_data, prompt, conversation_history
+                    ):
+                        # 에이전트 인덱스 (0-based, 예: "Agent 3" -> 2)
+                        agent_num = result['agent_index']
 
-                # 순서대로 정렬 (완료 순서가 다를 수 있으므로)
-                agent_responses.sort(key=lambda x: int(x['agent'].split()[-1]))
+                        # 즉시 UI 업데이트
+                        with agent_containers[agent_num].container():
+                            st.subheader(f"📋 {result['agent']}")
+                            st.markdown(result['response'])
+                            if agent_num < 5:
+                                st.divider()
 
-                # 모든 에이전트 완료
-                progress_display.markdown("✓ 모든 에이전트 완료 | ⏳ 최종 답변 통합 중...")
+                        completed_count += 1
+                        progress_display.markdown(f"✓ {result['agent']} 완료 ({completed_count}/6)")
 
-                # === Head Agent로 최종 응답 생성 ===
-                head_response = run_head_agent(
-                    client, agent_responses, prompt, conversation_history
-                )
+                        agent_responses.append(result)
 
-                # 응답 텍스트 추출
-                if isinstance(head_response, dict):
-                    final_response = head_response.get("response", "응답을 생성할 수 없습니다.")
-                else:
-                    final_response = head_response
-
-                # === [섹션 2] 자동으로 닫기 ===
-                agent_status.update(
-                    label="🤖 각 에이전트 답변 보기",
-                    state="complete",
-                    expanded=False
-                )
-
-                # === [섹션 1] 완료 상태 ===
-                progress_display.markdown("✅ 답변 생성 완료!")
-                time.sleep(0.3)
-                progress_display.empty()
-
-                # === [섹션 3] 최종 답변 표시 ===
-                with final_answer_section.container():
-                    st.markdown("### 📌 최종 답변")
-                    st.markdown(final_response)
+                    # 순서대로 정렬 (완료 순서가 다를 수 있으므로)
+                    agent_responses.sort(key=lambda x: x['agent_index'])
+
+                    # 모든 에이전트 완료
+                    progress_display.markdown("✓ 모든 에이전트 완료 | ⏳ 최종 답변 통합 중...")
+
+                    # === [섹션 2] 자동으로 닫기 (최종 답변이 바로 보이도록 스트리밍 전에 접기) ===
+                    agent_status.update(
+                        label="🤖 각 에이전트 답변 보기",
+                        state="complete",
+                        expanded=False
+                    )
+
+                    # === [섹션 3] Head Agent 최종 답변을 생성되는 대로 표시 ===
+                    # 스트리밍 도중 실패하면 head_errors에 오류가 기록됨 (이미 일부 텍스트가 표시되었을 수 있음)
+                    head_errors = []
+                    with final_answer_section.container():
+                        st.markdown("### 📌 최종 답변")
+                        final_response = st.write_stream(
+                            stream_head_agent(
+                                client, agent_responses, prompt, conversation_history, errors=head_errors
+                            )
+                        )
+                        if not final_response:
+                            head_errors.append("빈 응답")
+                            final_response = "응답을 생성할 수 없습니다."
+                            st.markdown(final_response)
+
+                    # === [섹션 1] 완료 상태 ===
+                    progress_display.markdown("✅ 답변 생성 완료!")
+                    time.sleep(0.3)
+                    progress_display.empty()
+
+                    # 응답 캐시 사용 시 오류 응답이 없을 때만 저장
+                    if cache_key is not None:
+                        has_error = bool(head_errors) or any(
+                            resp['agent'] == "Error Agent" or resp['response'].startswith("오류 발생")
+                            for resp in agent_responses
+                        )
+                        if not has_error:
+                            store_cached_response(cache_key, final_response, agent_responses)
 
                 # 응답 및 에이전트 답변 저장
                 st.session_state.messages.append({"role": "assistant", "content": final_response})
@@ -281,15 +332,27 @@ with tab2:
         if not has_data_files:
             st.error("데이터 파일이 로드되지 않았습니다.")
         else:
-            with st.spinner("검색 중..."):
-                # 검색 수행
-                results = search_precedent(
-                    search_query,
-                    st.session_state.loaded_data["court_cases"],
-                    st.session_state.loaded_data["tax_cases"],
-                    top_k=max_results,
-                    min_score=min_score
-                )
+            # 검색어/옵션/데이터 버전이 바뀐 경우에만 검색 수행 (다운로드 버튼 등으로 인한 rerun 시 이전 결과 재사용)
+            search_key = (search_query, max_results, min_score, st.session_state.get("data_version"))
+            if st.session_state.get("last_search_key") != search_key:
+                with st.spinner("검색 중..."):
+                    # 검색 수행
+                    st.session_state.last_search_results = search_precedent_cached(
+                        search_query,
+                        max_results,
+                        min_score,
+                        st.session_state.get("data_version"),
+                        st.session_state.loaded_data["court_cases"],
+                        st.session_state.loaded_data["tax_cases"]
+                    )
+                st.session_state.last_search_key = search_key
+                # 다운로드용 JSON은 검색 시 한 번만 직렬화하고 rerun 시 재사용
+                st.session_state.last_search_json = [
+                    orjson.dumps(result['data'], option=orjson.OPT_INDENT_2).decode()
+                    for result in st.session_state.last_search_results
+                ]
+            results = st.session_state.last_search_results
+            results_json = st.session_state.last_search_json
 
             # 결과 표시
             if results:
@@ -382,7 +445,7 @@ with tab2:
                         col_dl1, col_dl2 = st.columns(2)
                         with col_dl1:
                             # JSON 다운로드
-                            json_str = json.dumps(data, ensure_ascii=False, indent=2)
+                            json_str = results_json[i - 1]
                             st.download_button(
                                 label="📥 JSON 다운로드",
                                 data=json_str,
@@ -2,15 +2,16 @@ import streamlit as st
 import os
 import time
 import logging
-import json
+import orjson
 from utils import (
     initialize_client,
     check_data_files,
     load_data,
+    get_data_version,
     run_parallel_agents,
     run_head_agent,
     get_conversation_history,
-    search_precedent,
+    search_precedent_cached,
     format_precedent_title,
     format_precedent_summary
 )
@@ -110,19 +111,23 @@ with st.sidebar:
         st.success("새로운 대화가 시작되었습니다.")
 
 # 실행 시 데이터 파일 존재 여부 확인
-has_data_files = check_data_files()
+# (get_data_version의 수정 시각 조회 결과를 재사용하고, 파일이 없을 때만 check_data_files로 오류 표시)
+data_version = get_data_version()
+has_data_files = None not in data_version or check_data_files()
 if not has_data_files:
     st.warning("일부 데이터 파일이 없습니다. 예시 데이터를 사용하거나 필요한 파일을 추가해주세요.")
 else:
-    # 데이터가 아직 로드되지 않았다면 로드
-    if not st.session_state.loaded_data["court_cases"]:
+    # 데이터가 아직 로드되지 않았거나 데이터 파일이 갱신되었다면 로드
+    # (load_data는 프로세스 전체에서 캐시되므로 다른 세션이 이미 로드했다면 즉시 반환)
+    if st.session_state.get("data_version") != data_version:
         with st.spinner("데이터를 로드하고 전처리 중입니다..."):
-            court_cases, tax_cases, preprocessed_data = load_data()
+            court_cases, tax_cases, preprocessed_data = load_data(data_version)
             st.session_state.loaded_data = {
                 "court_cases": court_cases,
                 "tax_cases": tax_cases,
                 "preprocessed_data": preprocessed_data
             }
+            st.session_state.data_version = data_version
             st.success("데이터 로드 및 전처리가 완료되었습니다.")
 
 # ==================== 탭 1: 챗봇 모드 ====================
@@ -148,11 +153,11 @@ with tab1:
                         if agent_responses:
                             # 에이전트 답변 표시 (expander)
                             with st.status("🤖 각 에이전트 답변 보기", state="complete", expanded=False):
-                                for resp in agent_responses:
-                                    st.subheader(f"📋 {resp['agent']}")
-                                    st.markdown(resp['response'])
-                                    if resp != agent_responses[-1]:
-                                        st.divider()
+                                # 이전 답변은 하나의 markdown으로 묶어서 한 번에 렌더링
+                                st.markdown("\n\n---\n\n".join(
+                                    f"### 📋 {resp['agent']}\n\n{resp['response']}"
+                                    for resp in agent_responses
+                                ))
 
                             st.divider()
 
@@ -216,8 +221,8 @@ with tab1:
                     for result in run_parallel_agents(
                         st.session_state.client, court_cases, tax_cases, preprocessed_data, prompt, conversation_history
                     ):
-                        # 에이전트 인덱스 추출 (예: "Agent 3" -> 2)
-                        agent_num = int(result['agent'].split()[-1]) - 1
+                        # 에이전트 인덱스 (0-based, 예: "Agent 3" -> 2)
+                        agent_num = result['agent_index']
 
                         # 즉시 UI 업데이트
                         with agent_containers[agent_num].container():
@@ -232,7 +237,7 @@ with tab1:
                         agent_responses.append(result)
 
                     # 순서대로 정렬 (완료 순서가 다를 수 있으므로)
-                    agent_responses.sort(key=lambda x: int(x['agent'].split()[-1]))
+                    agent_responses.sort(key=lambda x: x['agent_index'])
 
                     # 모든 에이전트 완료
                     progress_display.markdown("✓ 모든 에이전트 완료 | ⏳ 최종 답변 통합 중...")
@@ -311,15 +316,27 @@ with tab2:
         if not has_data_files:
             st.error("데이터 파일이 로드되지 않았습니다.")
         else:
-            with st.spinner("검색 중..."):
-                # 검색 수행
-                results = search_precedent(
-                    search_query,
-                    st.session_state.loaded_data["court_cases"],
-                    st.session_state.loaded_data["tax_cases"],
-                    top_k=max_results,
-                    min_score=min_score
-                )
+            # 검색어/옵션/데이터 버전이 바뀐 경우에만 검색 수행 (다운로드 버튼 등으로 인한 rerun 시 이전 결과 재사용)
+            search_key = (search_query, max_results, min_score, st.session_state.get("data_version"))
+            if st.session_state.get("last_search_key") != search_key:
+                with st.spinner("검색 중..."):
+                    # 검색 수행
+                    st.session_state.last_search_results = search_precedent_cached(
+                        search_query,
+                        max_results,
+                        min_score,
+                        st.session_state.get("data_version"),
+                        st.session_state.loaded_data["court_cases"],
+                        st.session_state.loaded_data["tax_cases"]
+                    )
+                st.session_state.last_search_key = search_key
+                # 다운로드용 JSON은 검색 시 한 번만 직렬화하고 rerun 시 재사용
+                st.session_state.last_search_json = [
+                    orjson.dumps(result['data'], option=orjson.OPT_INDENT_2).decode()
+                    for result in st.session_state.last_search_results
+                ]
+            results = st.session_state.last_search_results
+            results_json = st.session_state.last_search_json
 
             # 결과 표시
             if results:
@@ -412,7 +429,7 @@ with tab2:
                         col_dl1, col_dl2 = st.columns(2)
                         with col_dl1:
                             # JSON 다운로드
-                            json_str = json.dumps(data, ensure_ascii=False, indent=2)
+                            json_str = results_json[i - 1]
                             st.download_button(
                                 label="📥 JSON 다운로드",
                                 data=json_str,
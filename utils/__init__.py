@@ -7,13 +7,20 @@ Legal Precedents Chatbot Utilities
 from .config import initialize_client
 
 # 대화 관리
-from .conversation import get_conversation_history
+from .conversation import (
+    get_conversation_history,
+    get_response_cache_key,
+    get_cached_response,
+    store_cached_response
+)
 
 # 데이터 로더
 from .data_loader import (
     check_data_files,
     extract_zip_file,
     load_data,
+    get_data_version,
+    search_precedent_cached,
     save_vectorization_cache,
     load_vectorization_cache
 )
@@ -22,7 +29,7 @@ from .data_loader import (
 from .text_processor import preprocess_text, extract_text_from_item
 
 # 벡터화 및 검색
-from .vectorizer import preprocess_data, search_relevant_data
+from .vectorizer import preprocess_data, vectorize_query, search_relevant_data
 
 # 에이전트
 from .agent import (
@@ -30,7 +37,9 @@ from .agent import (
     run_agent,
     run_parallel_agents,
     prepare_head_agent_input,
-    run_head_agent
+    build_head_agent_prompt,
+    run_head_agent,
+    stream_head_agent
 )
 
 # 판례 검색
@@ -45,21 +54,23 @@ __all__ = [
     'initialize_client',
 
     # 대화 관리
-    'get_conversation_history',
+    'get_conversation_history', 'get_response_cache_key', 'get_cached_response',
+    'store_cached_response',
 
     # 데이터 로더
-    'check_data_files', 'extract_zip_file', 'load_data',
-    'save_vectorization_cache', 'load_vectorization_cache',
+    'check_data_files', 'extract_zip_file', 'load_data', 'get_data_version',
+    'search_precedent_cached', 'save_vectorization_cache', 'load_vectorization_cache',
 
     # 텍스트 처리
     'preprocess_text', 'extract_text_from_item',
 
     # 벡터화 및 검색
-    'preprocess_data', 'search_relevant_data',
+    'preprocess_data', 'vectorize_query', 'search_relevant_data',
 
     # 에이전트
     'get_agent_prompt', 'run_agent', 'run_parallel_agents',
-    'prepare_head_agent_input', 'run_head_agent',
+    'prepare_head_agent_input', 'build_head_agent_prompt', 'run_head_agent',
+    'stream_head_agent',
 
     # 판례 검색
     'search_precedent', 'format_precedent_title', 'format_precedent_summary'
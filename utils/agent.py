@@ -8,7 +8,7 @@ import logging
 import time
 from concurrent.futures import ThreadPoolExecutor
 from google.genai import types
-from .vectorizer import search_relevant_data
+from .vectorizer import search_relevant_data, vectorize_query
 
 
 def get_agent_prompt(agent_type):
@@ -49,7 +49,7 @@ def get_agent_prompt(agent_type):
 """
 
 
-def run_agent(client, agent_type, user_query, preprocessed_data, chunk_info, agent_index=None, conversation_history=""):
+def run_agent(client, agent_type, user_query, preprocessed_data, chunk_info, agent_index=None, conversation_history="", query_vec=None):
     """특정 유형의 에이전트 실행 (통합 벡터화 데이터 사용)"""
     # 프롬프트 생성
     prompt = get_agent_prompt(agent_type)
@@ -57,7 +57,7 @@ def run_agent(client, agent_type, user_query, preprocessed_data, chunk_info, age
     # 질문과 관련성이 높은 데이터 검색
     relevant_data = search_relevant_data(
         user_query, preprocessed_data, chunk_info,
-        conversation_history=conversation_history
+        conversation_history=conversation_history, query_vec=query_vec
     )
 
     # 관련 데이터가 없는 경우 처리
@@ -117,6 +117,9 @@ def run_parallel_agents(client, court_cases, tax_cases, preprocessed_data, user_
         # 청크 정보 가져오기
         chunks_info = preprocessed_data["chunks_info"]
 
+        # 쿼리 벡터는 모든 에이전트가 동일하므로 한 번만 계산하여 공유
+        query_vec = vectorize_query(user_query, preprocessed_data, conversation_history)
+
         # ThreadPoolExecutor로 병렬 처리
         with ThreadPoolExecutor(max_workers=6) as executor:
             # future -> index 매핑
@@ -127,14 +130,23 @@ def run_parallel_agents(client, court_cases, tax_cases, preprocessed_data, user_
                 agent_type = chunk_info['agent_type']
                 future = executor.submit(
                     run_agent, client, agent_type, user_query,
-                    preprocessed_data, chunk_info, i, conversation_history
+                    preprocessed_data, chunk_info, i, conversation_history, query_vec
                 )
                 future_to_index[future] = i - 1  # 0-based index 저장
 
             # 완료되는 순서대로 처리하며 즉시 yield
             for future in as_completed(future_to_index.keys()):
                 index = future_to_index[future]
-                result = future.result()
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # 개별 에이전트 실패는 해당 에이전트 자리에 오류 응답으로 표시
+                    logging.error(f"Agent {index + 1} 실행 오류: {str(e)}")
+                    result = {
+                        "agent": f"Agent {index + 1}",
+                        "response": f"오류 발생: {str(e)}"
+                    }
+                result['agent_index'] = index  # 0-based 에이전트 인덱스 (UI 배치 및 정렬용)
                 results[index] = result
 
                 # 완료된 결과 즉시 반환
@@ -146,9 +158,11 @@ def run_parallel_agents(client, court_cases, tax_cases, preprocessed_data, user_
 
     except Exception as e:
         logging.error(f"병렬 에이전트 실행 오류: {str(e)}")
+        # 아직 결과가 없는 첫 번째 에이전트 자리에 표시 (UI 배치 및 정렬용 인덱스 필요)
         yield {
             "agent": "Error Agent",
-            "response": f"에이전트 실행 중 오류가 발생했습니다: {str(e)}"
+            "response": f"에이전트 실행 중 오류가 발생했습니다: {str(e)}",
+            "agent_index": next((i for i, result in enumerate(results) if result is None), 0)
         }
 
 
@@ -176,8 +190,8 @@ def prepare_head_agent_input(agent_responses, max_tokens=200000):
     return agent_responses
 
 
-def run_head_agent(client, agent_responses, user_query, conversation_history=""):
-    """각 에이전트의 응답을 통합하여 최종 응답 생성"""
+def build_head_agent_prompt(agent_responses, user_query, conversation_history=""):
+    """각 에이전트의 응답을 모아 Head Agent 전체 프롬프트 구성"""
     # 토큰 관리 (입력 용량 초과 방지)
     agent_responses = prepare_head_agent_input(agent_responses, max_tokens=200000)
 
@@ -195,6 +209,12 @@ def run_head_agent(client, agent_responses, user_query, conversation_history="")
         context_str = f"\n\n# 이전 대화 기록\n{conversation_history}"
 
     full_prompt = f"{prompt}{context_str}\n\n# 에이전트 응답\n{responses_str}\n\n# 질문\n{user_query}\n\n# 지시사항\n위 에이전트들의 응답을 통합하여 사용자의 질문에 가장 적합한 최종 답변을 작성하세요. 이전 대화 맥락을 고려하여 일관성 있게 응답하세요."
+    return full_prompt
+
+
+def run_head_agent(client, agent_responses, user_query, conversation_history=""):
+    """각 에이전트의 응답을 통합하여 최종 응답 생성"""
+    full_prompt = build_head_agent_prompt(agent_responses, user_query, conversation_history)
 
     try:
         # Gemini 모델 호출
@@ -218,3 +238,35 @@ def run_head_agent(client, agent_responses, user_query, conversation_history="")
         error_msg = f"Head Agent 오류 발생: {str(e)}"
         logging.error(error_msg)
         return error_msg
+
+
+def stream_head_agent(client, agent_responses, user_query, conversation_history="", errors=None):
+    """각 에이전트의 응답을 통합한 최종 응답을 생성되는 대로 텍스트 조각 단위로 yield (st.write_stream용)
+
+    일부 텍스트를 이미 yield한 뒤에도 실패할 수 있으므로, 오류가 발생하면
+    errors 리스트(주어진 경우)에 오류 메시지를 추가해 호출 측에서 실패 여부를 확인할 수 있게 합니다.
+    """
+    full_prompt = build_head_agent_prompt(agent_responses, user_query, conversation_history)
+
+    try:
+        # Gemini 모델 스트리밍 호출
+        for chunk in client.models.generate_content_stream(
+            model="gemini-2.5-flash",
+            contents=full_prompt,
+            config=types.GenerateContentConfig(
+                temperature=0.1,
+                top_k=5,
+                top_p=0.8
+            )
+        ):
+            if chunk.text:
+                yield chunk.text
+
+        logging.info("Head Agent 응답 생성 완료")
+
+    except Exception as e:
+        error_msg = f"Head Agent 오류 발생: {str(e)}"
+        logging.error(error_msg)
+        if errors is not None:
+            errors.append(error_msg)
+        yield error_msg
@@ -24,3 +24,30 @@ def get_conversation_history(max_messages=10):
         conversation += f"{role}: {msg['content']}\n\n"
 
     return conversation
+
+
+# 세션별 응답 캐시 최대 항목 수
+RESPONSE_CACHE_SIZE = 128
+
+
+def get_response_cache_key(prompt, data_version=None):
+    """응답 캐시 키 생성 (공백을 정규화한 질문 + 데이터 버전)
+
+    대화 맥락을 사용하지 않을 때만 사용합니다. 맥락을 사용하면 이전 질문/답변이
+    맥락에 포함되어 같은 질문도 다시 일치하지 않습니다.
+    """
+    return (" ".join(prompt.split()), data_version)
+
+
+def get_cached_response(cache_key):
+    """같은 질문으로 이전에 생성한 (최종 답변, 에이전트 답변) 반환 (없으면 None)"""
+    return st.session_state.get("response_cache", {}).get(cache_key)
+
+
+def store_cached_response(cache_key, final_response, agent_responses):
+    """생성한 답변을 응답 캐시에 저장 (최대 항목 수 초과 시 가장 오래된 항목부터 제거)"""
+    cache = st.session_state.setdefault("response_cache", {})
+    cache.pop(cache_key, None)
+    cache[cache_key] = (final_response, agent_responses)
+    while len(cache) > RESPONSE_CACHE_SIZE:
+        del cache[next(iter(cache))]
@@ -4,13 +4,15 @@ Data Loading and Caching
 """
 
 import streamlit as st
-import json
+import orjson
 import os
 import zipfile
 import tempfile
 import pickle
 import gzip
+import hashlib
 import logging
+import numpy as np
 
 
 def check_data_files():
@@ -45,8 +47,8 @@ def extract_zip_file(zip_path):
 
             # JSON 파일 로드
             json_path = os.path.join(temp_dir, json_files[0])
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(json_path, 'rb') as f:
+                data = orjson.loads(f.read())
 
             return data
     except Exception as e:
@@ -55,6 +57,13 @@ def extract_zip_file(zip_path):
         return []
 
 
+def is_cache_current(preprocessed_data, data_hash):
+    """벡터화 캐시가 현재 데이터 파일로 만들어졌는지 확인 (해시가 없는 이전 캐시는 다시 생성)"""
+    if data_hash is None:
+        return True
+    return preprocessed_data.get("data_hash") == data_hash
+
+
 def save_vectorization_cache(preprocessed_data):
     """벡터화 결과를 gzip 압축하여 저장 (로컬 환경 전용)"""
     cache_file = "vectorization_cache.pkl.gz"
@@ -72,8 +81,12 @@ def save_vectorization_cache(preprocessed_data):
         return False
 
 
-def load_vectorization_cache():
-    """저장된 gzip 압축 벡터화 결과를 로드"""
+def load_vectorization_cache(data_hash=None):
+    """저장된 gzip 압축 벡터화 결과를 로드
+
+    data_hash가 주어지고 캐시에 저장된 데이터 해시와 다르거나 해시가 없으면(데이터 파일 변경 또는
+    이전 형식 캐시) None을 반환합니다.
+    """
     cache_file = "vectorization_cache.pkl.gz"
 
     # 하위 호환성: 기존 pkl 파일도 지원
@@ -84,6 +97,9 @@ def load_vectorization_cache():
         if os.path.exists(cache_file):
             with gzip.open(cache_file, 'rb') as f:
                 preprocessed_data = pickle.load(f)
+            if not is_cache_current(preprocessed_data, data_hash):
+                logging.info(f"데이터 파일이 변경되어 벡터화 캐시를 사용하지 않습니다: {cache_file}")
+                return None
             file_size = os.path.getsize(cache_file) / 1024 / 1024  # MB
             logging.info(f"벡터화 캐시 로드 완료: {cache_file} ({file_size:.2f} MB)")
             return preprocessed_data
@@ -92,6 +108,9 @@ def load_vectorization_cache():
         elif os.path.exists(legacy_cache_file):
             with open(legacy_cache_file, 'rb') as f:
                 preprocessed_data = pickle.load(f)
+            if not is_cache_current(preprocessed_data, data_hash):
+                logging.info(f"데이터 파일이 변경되어 벡터화 캐시를 사용하지 않습니다: {legacy_cache_file}")
+                return None
             logging.info(f"레거시 캐시 로드 완료: {legacy_cache_file} (다음 저장 시 gzip으로 전환)")
             return preprocessed_data
 
@@ -101,41 +120,87 @@ def load_vectorization_cache():
         return None
 
 
-@st.cache_data
-def load_data():
-    """판례 데이터 로드"""
+def get_data_version():
+    """데이터 파일의 수정 시각을 반환 (load_data 캐시 키로 사용, 파일이 없으면 None)"""
+    version = []
+    for path in ("data_kcs.json", "data_moleg.json"):
+        try:
+            version.append(os.stat(path).st_mtime)
+        except OSError:
+            version.append(None)
+    return tuple(version)
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def load_data(data_version=None):
+    """판례 데이터 로드
+
+    st.cache_resource로 프로세스 전체 세션이 같은 객체를 공유하므로
+    (cache_data처럼 호출마다 복사하지 않음) 반환된 데이터는 수정하지 않아야 합니다.
+    data_version(get_data_version 결과)이 바뀌면 파일을 다시 로드하며,
+    이전 버전의 데이터와 인덱스는 캐시에서 제거됩니다 (max_entries=1).
+    """
     try:
+        # 원본 바이트로 읽어서 파싱과 캐시 검증용 해시 계산에 함께 사용
+        data_hash = hashlib.sha1()
+
         # 판례 데이터 로드1
-        with open("data_kcs.json", "r", encoding="utf-8") as f:
-            court_cases = json.load(f)
+        with open("data_kcs.json", "rb") as f:
+            court_bytes = f.read()
+        data_hash.update(court_bytes)
+        court_cases = orjson.loads(court_bytes)
         st.sidebar.success(f"KCS 판례 데이터 로드 완료: {len(court_cases)}건")
 
         # 판례 데이터 로드2
-        with open("data_moleg.json", "r", encoding="utf-8") as f:
-            tax_cases = json.load(f)
+        with open("data_moleg.json", "rb") as f:
+            tax_bytes = f.read()
+        data_hash.update(tax_bytes)
+        tax_cases = orjson.loads(tax_bytes)
         st.sidebar.success(f"MOLEG 판례 데이터 로드 완료: {len(tax_cases)}건")
 
-        # 캐시된 벡터화 결과 확인
-        preprocessed_data = load_vectorization_cache()
+        data_hash = data_hash.hexdigest()
+
+        # 캐시된 벡터화 결과 확인 (데이터 해시가 다르거나 없으면 다시 벡터화)
+        preprocessed_data = load_vectorization_cache(data_hash)
 
         if preprocessed_data is not None:
+            # float64로 저장된 이전 캐시는 float32로 변환 (쿼리 벡터도 같은 dtype이 되도록 vectorizer도 변경)
+            if preprocessed_data["tfidf_matrix"].dtype != np.float32:
+                preprocessed_data["tfidf_matrix"] = preprocessed_data["tfidf_matrix"].astype(np.float32)
+                preprocessed_data["vectorizer"].set_params(dtype=np.float32)
             st.sidebar.info("저장된 벡터화 인덱스를 로드했습니다.")
         else:
             # 캐시가 없으면 데이터 전처리 및 벡터화 수행
             st.sidebar.info("벡터화 인덱스를 생성 중입니다...")
             from .vectorizer import preprocess_data
             preprocessed_data = preprocess_data(court_cases, tax_cases)
+            preprocessed_data["data_hash"] = data_hash
             # 벡터화 결과 저장
             save_vectorization_cache(preprocessed_data)
             st.sidebar.success("벡터화 인덱스 생성 및 저장 완료!")
 
+        # 에이전트 청크별 행렬 미리 분할 (캐시 파일에는 저장하지 않음)
+        from .vectorizer import split_chunk_matrices
+        preprocessed_data["chunk_matrices"] = split_chunk_matrices(preprocessed_data)
+
         return court_cases, tax_cases, preprocessed_data
 
     except FileNotFoundError as e:
         st.sidebar.error(f"파일을 찾을 수 없습니다: {e}")
         st.error("필수 데이터 파일을 찾을 수 없습니다. 애플리케이션 디렉토리에 필요한 파일이 있는지 확인하세요.")
         return [], [], {}
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         st.sidebar.error(f"JSON 파일 파싱 오류: {e}")
         st.error("JSON 파일 형식이 올바르지 않습니다. 파일 형식을 확인하세요.")
         return [], [], {}
+
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def search_precedent_cached(query, top_k, min_score, data_version, _court_cases, _tax_cases):
+    """판례 검색 결과 캐시
+
+    (검색어, 최대 결과 수, 최소 점수, 데이터 버전)을 캐시 키로 사용하며,
+    밑줄로 시작하는 판례 데이터 인자는 해시에서 제외됩니다.
+    """
+    from .precedent_search import search_precedent
+    return search_precedent(query, _court_cases, _tax_cases, top_k=top_k, min_score=min_score)
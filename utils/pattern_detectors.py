@@ -4,6 +4,7 @@ Pattern Detection Module
 """
 
 import re
+from functools import lru_cache
 from typing import Optional, Dict, List
 from datetime import datetime
 
@@ -80,6 +81,9 @@ CUSTOMS_ALIASES = {
     "천안세관": ["천안세관"],
 }
 
+# 탐지 결과 캐시 크기 (판례 데이터의 사건번호/판례번호/날짜는 고정값이므로 검색마다 다시 파싱하지 않음)
+DETECTION_CACHE_SIZE = 8192
+
 
 # ==================== 연도 정규화 함수 ====================
 
@@ -115,6 +119,8 @@ def normalize_year(year_str: str) -> str:
 
 
 # ==================== 탐지 함수들 ====================
+# 사건번호/판례번호/날짜 탐지는 _cached_* 함수에서 lru_cache로 캐시하고,
+# 공개 함수는 호출 측이 결과를 수정해도 캐시가 오염되지 않도록 복사본을 반환합니다.
 
 def detect_case_number(query: str) -> Optional[Dict[str, str]]:
     """
@@ -133,6 +139,13 @@ def detect_case_number(query: str) -> Optional[Dict[str, str]]:
             'full': '대전지법2023구합208027'
         }
     """
+    result = _cached_detect_case_number(query)
+    return dict(result) if result else None
+
+
+@lru_cache(maxsize=DETECTION_CACHE_SIZE)
+def _cached_detect_case_number(query: str) -> Optional[Dict[str, str]]:
+    """detect_case_number의 캐시된 구현 (반환값은 캐시와 공유되므로 직접 노출하지 않음)"""
     match = re.search(CASE_NUMBER_PATTERN, query)
     if match:
         court, year, case_type, number = match.groups()
@@ -163,6 +176,13 @@ def detect_precedent_number(query: str) -> Optional[Dict[str, str]]:
             'full': '[대법원 2025. 2. 13. 선고 2023도1907 판결]'
         }
     """
+    result = _cached_detect_precedent_number(query)
+    return dict(result) if result else None
+
+
+@lru_cache(maxsize=DETECTION_CACHE_SIZE)
+def _cached_detect_precedent_number(query: str) -> Optional[Dict[str, str]]:
+    """detect_precedent_number의 캐시된 구현 (반환값은 캐시와 공유되므로 직접 노출하지 않음)"""
     # 완전한 판례번호 패턴 먼저 시도
     match = re.search(PRECEDENT_NUMBER_FULL_PATTERN, query)
     if match:
@@ -209,6 +229,12 @@ def detect_date(query: str) -> List[str]:
     Returns:
         탐지된 날짜 리스트 (YYYY-MM-DD 형식)
     """
+    return list(_cached_detect_date(query))
+
+
+@lru_cache(maxsize=DETECTION_CACHE_SIZE)
+def _cached_detect_date(query: str) -> List[str]:
+    """detect_date의 캐시된 구현 (반환값은 캐시와 공유되므로 직접 노출하지 않음)"""
     dates = []
 
     for pattern, pattern_type in DATE_PATTERNS:
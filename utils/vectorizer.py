@@ -5,8 +5,8 @@ Text Vectorization and Search
 
 import streamlit as st
 import logging
+import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 from .text_processor import preprocess_text, extract_text_from_item
 
 
@@ -49,12 +49,13 @@ def preprocess_data(court_cases, tax_cases):
         sublinear_tf=True,
         use_idf=True,
         smooth_idf=True,
-        norm='l2'
+        norm='l2',
+        dtype=np.float32  # 코사인 유사도 순위에는 float32로 충분 (행렬 메모리 절반)
     )
 
     logging.info("Character n-gram 벡터화 수행 중...")
     tfidf_matrix = vectorizer.fit_transform(corpus)
-    logging.info(f"벡터화 완료: {len(vectorizer.vocabulary_):,}개 character n-gram 특징")
+    logging.info(f"벡터화 완료: {len(vectorizer.vocabulary_):,}개 character n-gram 특징, 행렬 {tfidf_matrix.data.nbytes / 1024 / 1024:.1f}MB")
 
     # 4. 에이전트별로 데이터를 6개 청크로 분할 (기존 로직 유지)
     # Agent 1-2: KCS 데이터 2분할
@@ -108,18 +109,35 @@ def preprocess_data(court_cases, tax_cases):
     return result
 
 
-def search_relevant_data(query, preprocessed_data, chunk_info, top_n=5, conversation_history=""):
-    """질문과 관련성이 높은 데이터 항목을 검색 (통합 벡터화된 데이터 활용)"""
-    # 쿼리 전처리
+def split_chunk_matrices(preprocessed_data):
+    """에이전트 청크별 TF-IDF 행렬을 미리 분할 ((start_idx, end_idx) -> 행렬)
+
+    CSR 행 슬라이싱은 매번 데이터를 복사하므로 로드 시 한 번만 분할해 두고 검색에서 재사용합니다.
+    """
+    tfidf_matrix = preprocessed_data["tfidf_matrix"]
+    return {
+        (chunk['start_idx'], chunk['end_idx']): tfidf_matrix[chunk['start_idx']:chunk['end_idx']]
+        for chunk in preprocessed_data["chunks_info"]
+    }
+
+
+def vectorize_query(query, preprocessed_data, conversation_history=""):
+    """질문(및 대화 기록)을 전처리하여 TF-IDF 쿼리 벡터로 변환"""
     enhanced_query = query
     if conversation_history:
         enhanced_query = f"{query} {conversation_history}"
 
     enhanced_query = preprocess_text(enhanced_query)
+    return preprocessed_data["vectorizer"].transform([enhanced_query])
+
+
+def search_relevant_data(query, preprocessed_data, chunk_info, top_n=5, conversation_history="", query_vec=None):
+    """질문과 관련성이 높은 데이터 항목을 검색 (통합 벡터화된 데이터 활용)
 
+    query_vec이 주어지면 쿼리 벡터화를 생략합니다 (여러 에이전트가 같은 쿼리 벡터를 공유).
+    """
     try:
         # 통합 벡터화된 데이터 사용
-        vectorizer = preprocessed_data["vectorizer"]
         tfidf_matrix = preprocessed_data["tfidf_matrix"]
         all_data = preprocessed_data["all_data"]
 
@@ -127,17 +145,22 @@ def search_relevant_data(query, preprocessed_data, chunk_info, top_n=5, conversa
         start_idx = chunk_info['start_idx']
         end_idx = chunk_info['end_idx']
 
-        # 해당 청크의 TF-IDF 행렬만 추출
-        chunk_tfidf_matrix = tfidf_matrix[start_idx:end_idx]
+        # 해당 청크의 TF-IDF 행렬만 추출 (미리 분할해 둔 행렬이 있으면 재사용)
+        chunk_tfidf_matrix = preprocessed_data.get("chunk_matrices", {}).get((start_idx, end_idx))
+        if chunk_tfidf_matrix is None:
+            chunk_tfidf_matrix = tfidf_matrix[start_idx:end_idx]
 
         # 쿼리 벡터화
-        query_vec = vectorizer.transform([enhanced_query])
+        if query_vec is None:
+            query_vec = vectorize_query(query, preprocessed_data, conversation_history)
 
-        # 코사인 유사도 계산
-        similarities = cosine_similarity(query_vec, chunk_tfidf_matrix)[0]
+        # 코사인 유사도 계산 (문서/쿼리 벡터 모두 L2 정규화되어 있으므로 내적 = 코사인 유사도)
+        similarities = (chunk_tfidf_matrix @ query_vec.T).toarray().ravel()
 
-        # 유사도 기준으로 상위 n개 항목 선택
-        top_indices = similarities.argsort()[-top_n:][::-1]
+        # 유사도 기준으로 상위 n개 항목 선택 (argpartition으로 후보만 추린 뒤 정렬)
+        top_n = min(top_n, len(similarities))
+        top_indices = np.argpartition(similarities, -top_n)[-top_n:]
+        top_indices = top_indices[np.argsort(similarities[top_indices])[::-1]]
 
         # 유사도가 0보다 큰 항목만 선택
         relevant_data = []